@@ -12,21 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
-from functools import cached_property
+import multiprocessing
+import os
+import queue
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cached_property, lru_cache, partial
+from itertools import repeat
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
     Tuple,
+    TypeVar,
     Union,
 )
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as pa_ds
 from datasets import (
     Dataset,
     DatasetInfo,
@@ -35,6 +49,7 @@ from datasets import (
     load_dataset,
     load_from_disk,
 )
+from datasets.features.features import require_decoding
 from pydantic import Field, PrivateAttr
 from upath import UPath
 
@@ -43,8 +58,15 @@ from distilabel.mixins.runtime_parameters import RuntimeParameter
 from distilabel.steps.base import GeneratorStep
 
 if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
     from distilabel.steps.typing import GeneratorStepOutput
 
+T = TypeVar("T")
+
+_PREFETCH_END = object()
+_STREAMING_PREFETCH_FACTOR = 2
+
 
 class LoadDataFromHub(GeneratorStep):
     """Loads a dataset from the Hugging Face Hub.
@@ -70,6 +92,19 @@ class LoadDataFromHub(GeneratorStep):
             By default will load all examples.
         - `storage_options`: Key/value pairs to be passed on to the file-system backend, if any.
             Defaults to `None`.
+        - `prefetch_factor`: The number of batches to read ahead from the dataset in a
+            background thread while the current batch is being processed. `0` disables
+            prefetching. Defaults to `None`, which reads ahead 2 batches for streaming
+            datasets, so downloading the next batches overlaps with processing the
+            current one, and disables prefetching otherwise.
+        - `transform_workers`: The number of processes used to transform the batches into
+            rows, so it doesn't become the bottleneck for wide or large batches. The
+            `max(transform_workers, prefetch_factor)` following batches are submitted
+            to the pool while the current one is yielded. The workers are started with
+            `spawn` when the step is loaded, so they import the main module of the
+            script again, and the code running the pipeline must be guarded by
+            `if __name__ == "__main__":`. By default the batches are transformed in the
+            process of the step.
 
     Output columns:
         - dynamic (`all`): The columns that will be generated by this step, based on the
@@ -124,8 +159,25 @@ class LoadDataFromHub(GeneratorStep):
         default=None,
         description="The storage options to use when loading the dataset.",
     )
+    prefetch_factor: Optional[RuntimeParameter[int]] = Field(
+        default=None,
+        description="The number of batches to read ahead from the dataset in a background"
+        " thread. 0 disables prefetching. By default, 2 batches are read ahead for streaming"
+        " datasets and prefetching is disabled otherwise.",
+    )
+    transform_workers: Optional[RuntimeParameter[int]] = Field(
+        default=None,
+        description="The number of processes used to transform the batches into rows."
+        " The code running the pipeline must be guarded by `if __name__ == '__main__':`."
+        " By default the batches are transformed in the process of the step.",
+    )
 
     _dataset: Union[IterableDataset, Dataset, None] = PrivateAttr(None)
+    _columns: Optional[Tuple[str, ...]] = PrivateAttr(None)
+    _num_examples_cache: Optional[int] = PrivateAttr(None)
+    _columns_cache: Optional[List[str]] = PrivateAttr(None)
+    _info_cache_key: Optional[Tuple[str, Optional[str]]] = PrivateAttr(None)
+    _transform_pool: Optional[ProcessPoolExecutor] = PrivateAttr(None)
 
     def load(self) -> None:
         """Load the dataset from the Hugging Face Hub"""
@@ -133,6 +185,8 @@ class LoadDataFromHub(GeneratorStep):
 
         if self._dataset is not None:
             # Here to simplify the functionality of distilabel.steps.generators.util.make_generator_step
+            self._cache_columns()
+            self._start_transform_pool()
             return
 
         self._dataset = load_dataset(
@@ -147,7 +201,10 @@ class LoadDataFromHub(GeneratorStep):
         )
 
         if not self.streaming:
-            self._dataset = self._dataset.select(range(self.num_examples))
+            self._select_num_examples()
+
+        self._cache_columns()
+        self._start_transform_pool()
 
     def process(self, offset: int = 0) -> "GeneratorStepOutput":
         """Yields batches from the loaded dataset from the Hugging Face Hub.
@@ -160,16 +217,21 @@ class LoadDataFromHub(GeneratorStep):
             A tuple containing a batch of rows and a boolean indicating if the batch is
             the last one.
         """
-        num_returned_rows = 0
-        for batch_num, batch in enumerate(
-            self._dataset.iter(batch_size=self.batch_size)  # type: ignore
-        ):
-            if batch_num * self.batch_size < offset:
-                continue
-            transformed_batch = self._transform_batch(batch)
-            batch_size = len(transformed_batch)
-            num_returned_rows += batch_size
-            yield transformed_batch, num_returned_rows >= self.num_examples
+        bs, limit = self.batch_size, self.num_examples
+        # All the batches are `batch_size` long but the last one, so the index of the
+        # batch containing the last example to be returned can be computed in advance
+        last_batch_index = (limit - offset + bs - 1) // bs - 1  # type: ignore
+        for batch_num, transformed_batch in enumerate(self._iter_batches(offset)):
+            yield transformed_batch, batch_num >= last_batch_index
+
+    def unload(self) -> None:
+        """Shuts down the pool of processes used to transform the batches into rows, if
+        any.
+        """
+        super().unload()
+        if self._transform_pool is not None:
+            self._transform_pool.shutdown(wait=True, cancel_futures=True)
+            self._transform_pool = None
 
     @property
     def outputs(self) -> List[str]:
@@ -181,7 +243,161 @@ class LoadDataFromHub(GeneratorStep):
         """
         return self._get_dataset_columns()
 
-    def _transform_batch(self, batch: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _select_num_examples(self) -> None:
+        """Keeps only the first `num_examples` rows of the loaded `Dataset`, capping
+        `num_examples` to the number of rows of the dataset.
+
+        `select` with a contiguous range is a zero-copy slice of the underlying Arrow
+        table, so it doesn't create an indices mapping that would have to be followed
+        while iterating. If all the rows are kept, no new dataset is created.
+        """
+        num_rows = len(self._dataset)  # type: ignore
+        if self.num_examples < num_rows:  # type: ignore
+            self._dataset = self._dataset.select(range(self.num_examples))  # type: ignore
+        else:
+            self.num_examples = num_rows
+
+    def _cache_columns(self) -> None:
+        """Caches the names of the columns of the loaded dataset, so the order of the
+        columns in the rows is computed once instead of for every batch. Streaming
+        datasets may not know their columns until they're iterated, in which case the
+        keys of each batch are used.
+        """
+        column_names = getattr(self._dataset, "column_names", None)
+        self._columns = tuple(column_names) if isinstance(column_names, list) else None
+
+    def _start_transform_pool(self) -> None:
+        """Creates the pool of processes used to transform the batches into rows if
+        `transform_workers` is greater than 1. The pool is created once, so its workers
+        are reused by every `process` call until the step is unloaded.
+
+        The batches are read by a background thread when prefetching, and forking a
+        process while other threads are running may leave locks held in the child, so
+        the workers are started with `spawn`.
+        """
+        if (
+            self._transform_pool is None
+            and self.transform_workers
+            and self.transform_workers > 1
+        ):
+            self._transform_pool = ProcessPoolExecutor(
+                max_workers=self.transform_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def _iter_batches(self, offset: int = 0) -> Iterator[List[Dict[str, Any]]]:
+        """Iterates over the loaded dataset in batches of `batch_size` rows, starting
+        from the row at `offset`.
+
+        If the dataset doesn't have a format set, its features are known and none of
+        them need decoding, the batches are read as `pyarrow.Table`s, so the rows are
+        built by Arrow instead of in Python. Otherwise, the batches are read as Python
+        dictionaries. If prefetching is enabled (see `prefetch_factor`), the batches
+        are read in a background thread, and if `transform_workers` is greater than 1,
+        they're transformed into rows in a pool of processes.
+
+        Args:
+            offset: The number of rows to skip from the start of the dataset.
+
+        Yields:
+            A list of rows, where each row is a dictionary of column names and values.
+        """
+        dataset = self._dataset
+        if offset:
+            if isinstance(dataset, IterableDataset):
+                dataset = dataset.skip(offset)
+            elif offset >= len(dataset):  # type: ignore
+                return
+            else:
+                # A contiguous `select` is a zero-copy slice of the Arrow table, so the
+                # skipped rows are neither read nor decoded
+                dataset = dataset.select(range(offset, len(dataset)))  # type: ignore
+
+        if self._can_iter_arrow():
+            batches = self._iter_arrow_batches(dataset)  # type: ignore
+        else:
+            batches = dataset.iter(batch_size=self.batch_size)  # type: ignore
+
+        if self._transform_pool is not None:
+            # Serialize the batches before they're sent to the pool, as pickling a slice
+            # of an Arrow table pickles the whole table. When prefetching, it's done by
+            # the background thread
+            batches = map(_compact_batch, batches)
+
+        prefetch_factor = self.prefetch_factor
+        if prefetch_factor is None:
+            # Reading the next batches of a streaming dataset means downloading them
+            prefetch_factor = (
+                _STREAMING_PREFETCH_FACTOR
+                if isinstance(dataset, IterableDataset)
+                else 0
+            )
+        if prefetch_factor > 0:
+            batches = _prefetch_iter(batches, prefetch_factor)
+
+        if self._transform_pool is not None:
+            yield from _map_in_processes(
+                self._transform_pool,
+                partial(_batch_to_rows, columns=self._columns),
+                batches,
+                window=max(self.transform_workers, prefetch_factor),  # type: ignore
+            )
+            return
+
+        transform = self._transform_batch
+        for batch in batches:
+            yield transform(batch)
+
+    def _iter_arrow_batches(
+        self, dataset: Union[Dataset, IterableDataset]
+    ) -> Iterator[pa.Table]:
+        """Iterates over a dataset in `pyarrow.Table`s of `batch_size` rows.
+
+        If the dataset is a `Dataset` without an indices mapping, the batches are zero-copy
+        slices of its underlying Arrow table, so the formatting done by `Dataset.iter`
+        for each batch is skipped.
+
+        Args:
+            dataset: The dataset to iterate over.
+
+        Yields:
+            A `pyarrow.Table` with the rows of the batch.
+        """
+        if isinstance(dataset, IterableDataset) or dataset._indices is not None:
+            yield from dataset.with_format("arrow").iter(batch_size=self.batch_size)
+            return
+
+        table = dataset.data.table
+        for start in range(0, table.num_rows, self.batch_size):
+            yield table.slice(start, self.batch_size)
+
+    def _can_iter_arrow(self) -> bool:
+        """Checks whether the loaded dataset can be iterated as `pyarrow.Table`s and still
+        produce the same rows as iterating it with the Python formatting.
+
+        Returns:
+            `True` if the dataset can be iterated as `pyarrow.Table`s, `False` otherwise.
+        """
+        if isinstance(self._dataset, Dataset):
+            dataset_format = self._dataset.format
+            # The Arrow batches contain all the columns, not only the formatted ones
+            if (
+                dataset_format["type"]
+                or dataset_format["columns"] != self._dataset.column_names
+                or dataset_format["output_all_columns"]
+            ):
+                return False
+
+        # Streaming datasets may not know their features, then the rows are built and
+        # cast by `datasets` from the first examples, which the Arrow batches would skip
+        features = self._dataset.features  # type: ignore
+        return features is not None and not any(
+            require_decoding(feature) for feature in features.values()
+        )
+
+    def _transform_batch(
+        self, batch: Union[pa.Table, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Transform a batch of data from the Hugging Face Hub into a list of rows.
 
         Args:
@@ -190,11 +406,7 @@ class LoadDataFromHub(GeneratorStep):
         Returns:
             A list of rows, where each row is a dictionary of column names and values.
         """
-        length = len(next(iter(batch.values())))
-        rows = []
-        for i in range(length):
-            rows.append({col: values[i] for col, values in batch.items()})
-        return rows
+        return _batch_to_rows(batch, self._columns)
 
     def _get_dataset_num_examples(self) -> int:
         """Get the number of examples in the dataset, based on the `split` and `config`
@@ -202,12 +414,17 @@ class LoadDataFromHub(GeneratorStep):
 
         Returns:
             The number of examples in the dataset.
+
+        Raises:
+            ValueError: If the `split` is not found in the dataset information.
         """
-        return (
-            self._dataset_info[self.config if self.config else "default"]
-            .splits[self.split]
-            .num_examples
-        )
+        self._populate_info_cache()
+        if self._num_examples_cache is None:
+            raise ValueError(
+                f"Split '{self.split}' not found in the information of the dataset"
+                f" '{self.repo_id}'."
+            )
+        return self._num_examples_cache
 
     def _get_dataset_columns(self) -> List[str]:
         """Get the columns of the dataset, based on the `config` runtime parameter provided.
@@ -215,11 +432,33 @@ class LoadDataFromHub(GeneratorStep):
         Returns:
             The columns of the dataset.
         """
-        return list(
-            self._dataset_info[
-                self.config if self.config else "default"
-            ].features.keys()
+        self._populate_info_cache()
+        return self._columns_cache  # type: ignore
+
+    def _populate_info_cache(self) -> None:
+        """Reads the number of examples and the columns of the dataset from its information,
+        based on the `split` and `config` runtime parameters provided, and caches them.
+        The runtime parameters may change after the information was first read (e.g.
+        `outputs` is called before they're set), so the cache is keyed on them.
+        """
+        cache_key = (self._config_key, self.split)
+        if self._info_cache_key == cache_key:
+            return
+
+        info = self._dataset_info[self._config_key]
+        splits = info.splits or {}
+        self._num_examples_cache = (
+            splits[self.split].num_examples if self.split in splits else None
         )
+        self._columns_cache = list(info.features)
+        self._info_cache_key = cache_key
+
+    @property
+    def _config_key(self) -> str:
+        """The key of the `config` runtime parameter in the dataset information, which is
+        `default` if no `config` was provided.
+        """
+        return self.config or "default"
 
     @cached_property
     def _dataset_info(self) -> Dict[str, DatasetInfo]:
@@ -232,7 +471,7 @@ class LoadDataFromHub(GeneratorStep):
         config = self.config
 
         try:
-            return get_dataset_infos(repo_id)
+            return _fetch_dataset_infos(repo_id)
         except Exception as e:
             # The previous could fail in case of a internet connection issues.
             # Assuming the dataset is already loaded and we can get the info from the loaded dataset, otherwise it will fail anyway.
@@ -245,6 +484,224 @@ class LoadDataFromHub(GeneratorStep):
             return ds.info
 
 
+def _batch_to_rows(
+    batch: Union[pa.Table, pa.Buffer, Dict[str, Any]],
+    columns: Optional[Tuple[str, ...]] = None,
+) -> List[Dict[str, Any]]:
+    """Transforms a batch of data into a list of rows. It's a module-level function so
+    it can be sent to the workers of a process pool.
+
+    Args:
+        batch: The batch of data, either a `pyarrow.Table`, a `pyarrow.Table` serialized
+            with `_compact_batch` or a dictionary of column names and values.
+        columns: The names of the columns of the batch, in the order they will have in
+            the rows. If not provided, or if the batch doesn't contain all of them (e.g.
+            a format restricted to some columns was set to the dataset), the keys of the
+            batch will be used. Defaults to `None`.
+
+    Returns:
+        A list of rows, where each row is a dictionary of column names and values.
+    """
+    if isinstance(batch, pa.Buffer):
+        batch = pa.ipc.open_stream(batch).read_all()
+    if isinstance(batch, pa.Table):
+        return batch.to_pylist()
+
+    cols = columns if columns and len(columns) == len(batch) else tuple(batch)
+    # Unbox the arrays of datasets formatted as `numpy` in bulk, instead of once per cell
+    values = tuple(
+        _to_python(value) if isinstance(value, np.ndarray) else value
+        for value in (batch[col] for col in cols)
+    )
+    # Build the rows with `map` so no bytecode is run per row
+    return list(map(dict, map(zip, repeat(cols), zip(*values))))
+
+
+def _to_python(value: Any) -> Any:
+    """Converts the `numpy` arrays and scalars within `value` into Python objects.
+
+    Arrays with a numeric or string dtype are converted in bulk with `tolist`. Object
+    arrays (e.g. variable-length lists or structs) contain other arrays, so their items
+    are converted recursively.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The value with the `numpy` arrays converted into lists and the `numpy` scalars
+        into Python scalars.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return _to_python(value.tolist())
+        return value.tolist()
+    if isinstance(value, list):
+        return [_to_python(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_python(item) for key, item in value.items()}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _compact_batch(
+    batch: Union[pa.Table, Dict[str, Any]],
+) -> Union[pa.Buffer, Dict[str, Any]]:
+    """Serializes a `pyarrow.Table` batch in the Arrow IPC format, so only its rows are
+    sent to a process pool. A slice of a table references the buffers of the whole table,
+    and pickling it copies all of them. Other batches are returned as they are.
+
+    Args:
+        batch: The batch of data, either a `pyarrow.Table` or a dictionary of column names
+            and values.
+
+    Returns:
+        The serialized `pyarrow.Table`, or the batch if it's a dictionary.
+    """
+    if not isinstance(batch, pa.Table):
+        return batch
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_table(batch)
+    return sink.getvalue()
+
+
+def _map_in_processes(
+    executor: ProcessPoolExecutor,
+    func: Callable[[Any], T],
+    iterable: Iterable[Any],
+    window: int,
+) -> Iterator[T]:
+    """Applies `func` to the items of `iterable` in a pool of processes, keeping up to
+    `window` items submitted to the pool at a time.
+
+    Args:
+        executor: The pool of processes.
+        func: The function to apply. It must be picklable.
+        iterable: The iterable with the items to apply the function to.
+        window: The maximum number of items submitted to the pool and not yet yielded.
+
+    Yields:
+        The results of applying `func` to the items of `iterable`, in the same order.
+    """
+    futures: Deque["Future[T]"] = deque()
+    try:
+        for item in iterable:
+            futures.append(executor.submit(func, item))
+            if len(futures) >= window:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        # The pool outlives the iteration, so drop the items of an abandoned one
+        for future in futures:
+            future.cancel()
+
+
+@lru_cache(maxsize=128)
+def _fetch_dataset_infos(repo_id: str) -> Dict[str, DatasetInfo]:
+    """Calls the Datasets Server API from Hugging Face to obtain the dataset information,
+    caching it so several steps loading the same dataset make a single request.
+
+    Args:
+        repo_id: The Hugging Face Hub repository ID of the dataset.
+
+    Returns:
+        The dataset information for each configuration of the dataset.
+    """
+    return get_dataset_infos(repo_id)
+
+
+def _count_arrow_rows(fs: "AbstractFileSystem", path: str) -> int:
+    """Counts the rows of an Arrow file, in either the IPC streaming or file format, from
+    its record batches.
+
+    Args:
+        fs: The file-system backend where the file is stored.
+        path: The path to the Arrow file.
+
+    Returns:
+        The number of rows in the file.
+    """
+    with fs.open(path, "rb") as f:
+        try:
+            return sum(batch.num_rows for batch in pa.ipc.open_stream(f))
+        except pa.ArrowInvalid:
+            f.seek(0)
+            reader = pa.ipc.open_file(f)
+            return sum(
+                reader.get_batch(i).num_rows for i in range(reader.num_record_batches)
+            )
+
+
+def _prefetch_iter(iterable: Iterable[T], n: int) -> Iterator[T]:
+    """Iterates over `iterable` in a background thread, keeping up to `n` items read
+    ahead of the consumer, so reading the next items overlaps with processing the
+    current one.
+
+    Args:
+        iterable: The iterable to read the items from.
+        n: The maximum number of items read ahead.
+
+    Yields:
+        The items of `iterable`, in the same order. If iterating `iterable` raises an
+        exception, it will be re-raised in the consumer.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=n)
+    stop = threading.Event()
+
+    thread = threading.Thread(
+        target=_prefetch_producer, args=(iterable, buffer, stop), daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _PREFETCH_END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # Let the producer finish if the consumer stops before exhausting the iterable
+        stop.set()
+
+
+def _prefetch_producer(
+    iterable: Iterable[Any],
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]",
+    stop: threading.Event,
+) -> None:
+    """Puts the items of `iterable` in `buffer` followed by `_PREFETCH_END`, until
+    the iterable is exhausted or `stop` is set.
+
+    Args:
+        iterable: The iterable to read the items from.
+        buffer: The queue where the items are put, along with the exception raised while
+            iterating, if any.
+        stop: The event set by the consumer when it stops reading from `buffer`.
+    """
+
+    def put(item: Any, error: Optional[BaseException] = None) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        for item in iterable:
+            if not put(item):
+                return
+    except BaseException as e:
+        put(_PREFETCH_END, e)
+        return
+    put(_PREFETCH_END)
+
+
 class LoadDataFromFileSystem(LoadDataFromHub):
     """Loads a dataset from a file in your filesystem.
 
@@ -270,6 +727,19 @@ class LoadDataFromFileSystem(LoadDataFromHub):
             Defaults to `None`.
         - `filetype`: The expected filetype. If not provided, it will be inferred from the file extension.
             For more than one file, it will be inferred from the first file.
+        - `prefetch_factor`: The number of batches to read ahead from the dataset in a
+            background thread while the current batch is being processed. `0` disables
+            prefetching. Defaults to `None`, which reads ahead 2 batches for streaming
+            datasets, so downloading the next batches overlaps with processing the
+            current one, and disables prefetching otherwise.
+        - `transform_workers`: The number of processes used to transform the batches into
+            rows, so it doesn't become the bottleneck for wide or large batches. The
+            `max(transform_workers, prefetch_factor)` following batches are submitted
+            to the pool while the current one is yielded. The workers are started with
+            `spawn` when the step is loaded, so they import the main module of the
+            script again, and the code running the pipeline must be guarded by
+            `if __name__ == "__main__":`. By default the batches are transformed in the
+            process of the step.
 
     Output columns:
         - dynamic (`all`): The columns that will be generated by this step, based on the
@@ -352,19 +822,28 @@ class LoadDataFromFileSystem(LoadDataFromHub):
         )
 
         if not self.streaming and self.num_examples:
-            self._dataset = self._dataset.select(range(self.num_examples))
+            self._select_num_examples()
         if not self.num_examples:
             if self.streaming:
-                # There's no better way to get the number of examples in a streaming dataset,
-                # load it again for the moment.
-                self.num_examples = len(
-                    load_dataset(
-                        self.filetype, data_files=self.data_files, split=self.split
+                num_examples = self._count_rows(data_files, self.filetype, data_path.fs)
+                if num_examples is None:
+                    # There's no better way to get the number of examples in a streaming dataset,
+                    # load it again for the moment.
+                    num_examples = len(
+                        load_dataset(
+                            self.filetype,
+                            data_files=data_files,
+                            split=self.split,
+                            storage_options=self.storage_options,
+                        )
                     )
-                )
+                self.num_examples = num_examples
             else:
                 self.num_examples = len(self._dataset)
 
+        self._cache_columns()
+        self._start_transform_pool()
+
     @staticmethod
     def _prepare_data_files(
         data_path: UPath,
@@ -388,15 +867,14 @@ class LoadDataFromFileSystem(LoadDataFromHub):
             filetype = get_filetype(data_path)
             data_files = str(data_path)
         elif data_path.is_dir():
-            file_sequence = []
-            file_map = defaultdict(list)
-            for file_or_folder in data_path.iterdir():
-                if file_or_folder.is_file():
-                    file_sequence.append(str(file_or_folder))
-                elif file_or_folder.is_dir():
-                    for file in file_or_folder.iterdir():
-                        file_sequence.append(str(file))
-                        file_map[str(file_or_folder)].append(str(file))
+            if data_path.protocol in ("", "file"):
+                file_sequence, file_map = LoadDataFromFileSystem._list_local_dir(
+                    data_path
+                )
+            else:
+                file_sequence, file_map = LoadDataFromFileSystem._list_remote_dir(
+                    data_path
+                )
 
             data_files = file_sequence or file_map
             # Try to obtain the filetype from any of the files, assuming all files have the same type.
@@ -406,6 +884,108 @@ class LoadDataFromFileSystem(LoadDataFromHub):
                 filetype = get_filetype(UPath(file_map[list(file_map.keys())[0]][0]))
         return data_files, filetype
 
+    @staticmethod
+    def _list_local_dir(data_path: UPath) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Lists the files in a local directory and in its subdirectories using `os.scandir`,
+        which gets the type of each entry while reading the directory, so no extra `stat`
+        call is needed per entry.
+
+        Args:
+            data_path: The path to the local directory.
+
+        Returns:
+            Tuple with the files in the directory and its subdirectories, and a mapping
+            from each subdirectory to the files it contains.
+        """
+        file_sequence = []
+        file_map = defaultdict(list)
+        with os.scandir(data_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    file_sequence.append(entry.path)
+                elif entry.is_dir():
+                    with os.scandir(entry.path) as sub_entries:
+                        for sub_entry in sub_entries:
+                            if sub_entry.is_file():
+                                file_sequence.append(sub_entry.path)
+                                file_map[entry.path].append(sub_entry.path)
+        return file_sequence, file_map
+
+    @staticmethod
+    def _list_remote_dir(data_path: UPath) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Lists the files in a remote directory and in its subdirectories with a single
+        `find` call to the file-system backend, instead of one call per entry to check
+        whether it's a file or a directory.
+
+        Args:
+            data_path: The path to the remote directory.
+
+        Returns:
+            Tuple with the files in the directory and its subdirectories, and a mapping
+            from each subdirectory to the files it contains.
+        """
+        root = data_path.path.rstrip("/")
+        entries = data_path.fs.find(root, maxdepth=2, withdirs=True, detail=True)
+
+        file_sequence = []
+        file_map = defaultdict(list)
+        for path, info in sorted(entries.items()):
+            parts = path[len(root) :].strip("/").split("/")
+            if info["type"] != "file":
+                continue
+            if len(parts) == 1:
+                file_sequence.append(str(data_path / parts[0]))
+            elif len(parts) == 2:
+                file = str(data_path / parts[0] / parts[1])
+                file_sequence.append(file)
+                file_map[str(data_path / parts[0])].append(file)
+        return file_sequence, file_map
+
+    @staticmethod
+    def _count_rows(
+        data_files: Union[str, Sequence[str], Mapping[str, Union[str, Sequence[str]]]],
+        filetype: str,
+        fs: "AbstractFileSystem",
+    ) -> Optional[int]:
+        """Counts the rows in the data files without loading them as a dataset:
+
+        - Parquet: the rows are read from the metadata in the footer of the files.
+        - Arrow: the rows are read from the record batches of the files, which are not
+            converted to Python objects.
+        - JSON Lines: the rows are counted as the non-empty lines of the files.
+
+        Args:
+            data_files: The data files, as returned by `_prepare_data_files`.
+            filetype: The filetype of the data files.
+            fs: The file-system backend where the data files are stored.
+
+        Returns:
+            The number of rows in the data files, or `None` if they cannot be counted
+            without loading the dataset.
+        """
+        if isinstance(data_files, str):
+            data_files = [data_files]
+        elif isinstance(data_files, Mapping):
+            return None
+
+        paths = [UPath(data_file).path for data_file in data_files]
+
+        if filetype == "parquet":
+            return pa_ds.dataset(paths, format="parquet", filesystem=fs).count_rows()
+
+        if filetype == "arrow":
+            return sum(_count_arrow_rows(fs, path) for path in paths)
+
+        # A `.json` file may contain a single JSON document instead of one per line
+        if filetype == "json" and all(path.endswith(".jsonl") for path in paths):
+            num_rows = 0
+            for path in paths:
+                with fs.open(path, "rb") as f:
+                    num_rows += sum(1 for line in f if line.strip())
+            return num_rows
+
+        return None
+
     @property
     def outputs(self) -> List[str]:
         """The columns that will be generated by this step, based on the datasets from a file
@@ -446,6 +1026,19 @@ class LoadDataFromDisk(LoadDataFromHub):
             By default will load all examples.
         - `storage_options`: Key/value pairs to be passed on to the file-system backend, if any.
             Defaults to `None`.
+        - `prefetch_factor`: The number of batches to read ahead from the dataset in a
+            background thread while the current batch is being processed. `0` disables
+            prefetching. Defaults to `None`, which reads ahead 2 batches for streaming
+            datasets, so downloading the next batches overlaps with processing the
+            current one, and disables prefetching otherwise.
+        - `transform_workers`: The number of processes used to transform the batches into
+            rows, so it doesn't become the bottleneck for wide or large batches. The
+            `max(transform_workers, prefetch_factor)` following batches are submitted
+            to the pool while the current one is yielded. The workers are started with
+            `spawn` when the step is loaded, so they import the main module of the
+            script again, and the code running the pipeline must be guarded by
+            `if __name__ == "__main__":`. By default the batches are transformed in the
+            process of the step.
 
     Output columns:
         - dynamic (`all`): The columns that will be generated by this step, based on the
@@ -533,15 +1126,20 @@ class LoadDataFromDisk(LoadDataFromHub):
     def load(self) -> None:
         """Load the dataset from the file/s in disk."""
         super(GeneratorStep, self).load()
-        if self.is_distiset:
+        if self.is_distiset and self.config:
+            # Each configuration of a `Distiset` is saved as a dataset in its own folder,
+            # so load just the requested one instead of the whole `Distiset`
+            ds = load_from_disk(
+                str(UPath(self.dataset_path) / self.config),
+                keep_in_memory=self.keep_in_memory,
+                storage_options=self.storage_options,
+            )
+        elif self.is_distiset:
             ds = Distiset.load_from_disk(
                 self.dataset_path,
                 keep_in_memory=self.keep_in_memory,
                 storage_options=self.storage_options,
             )
-            if self.config:
-                ds = ds[self.config]
-
         else:
             ds = load_from_disk(
                 self.dataset_path,
@@ -555,10 +1153,13 @@ class LoadDataFromDisk(LoadDataFromHub):
         self._dataset = ds
 
         if self.num_examples:
-            self._dataset = self._dataset.select(range(self.num_examples))
+            self._select_num_examples()
         else:
             self.num_examples = len(self._dataset)
 
+        self._cache_columns()
+        self._start_transform_pool()
+
     @property
     def outputs(self) -> List[str]:
         """The columns that will be generated by this step, based on the datasets from a file
@@ -13,12 +13,22 @@
 # limitations under the License.
 
 import os
+import pickle
 import tempfile
 from pathlib import Path
-from typing import Generator, Union
+from typing import Any, Dict, Generator, Union
+from unittest import mock
 
+import pyarrow as pa
 import pytest
-from datasets import Dataset, IterableDataset
+from datasets import (
+    Dataset,
+    IterableDataset,
+    SplitDict,
+    SplitInfo,
+    concatenate_datasets,
+)
+from upath import UPath
 
 from distilabel.distiset import Distiset
 from distilabel.pipeline import Pipeline
@@ -26,6 +36,7 @@ from distilabel.steps.generators.huggingface import (
     LoadDataFromDisk,
     LoadDataFromFileSystem,
     LoadDataFromHub,
+    _prefetch_iter,
 )
 
 DISTILABEL_RUN_SLOW_TESTS = os.getenv("DISTILABEL_RUN_SLOW_TESTS", False)
@@ -43,11 +54,14 @@ def dataset_loader() -> Generator[Union[Dataset, IterableDataset], None, None]:
     yield load_hub_dataset
 
 
-@pytest.mark.skipif(
+requires_internet = pytest.mark.skipif(
     not DISTILABEL_RUN_SLOW_TESTS,
     reason="These tests depend on internet connection, are slow and depend mainly on HF API, we don't need to test them often.",
 )
+
+
 class TestLoadDataFromHub:
+    @requires_internet
     @pytest.mark.parametrize(
         "streaming, ds_type", [(True, IterableDataset), (False, Dataset)]
     )
@@ -68,10 +82,210 @@ class TestLoadDataFromHub:
         assert isinstance(generator_step_output[1], bool)
         assert len(generator_step_output[0]) == 2
 
+    @requires_internet
     def test_dataset_outputs(self, dataset_loader: LoadDataFromHub) -> None:
         # TODO: This test can be run with/without internet connection, we should emulate it here with a mock.
         assert dataset_loader.outputs == ["prompt", "completion", "meta"]
 
+    def test_dataset_info_cached_by_repo_id(self) -> None:
+        infos = {"default": Dataset.from_dict({"a": [1]}).info}
+        with mock.patch(
+            "distilabel.steps.generators.huggingface.get_dataset_infos",
+            return_value=infos,
+        ) as get_dataset_infos:
+            for split in ["train", "test"]:
+                loader = LoadDataFromHub(
+                    repo_id="test_dataset_info_cached_by_repo_id", split=split
+                )
+                assert loader._dataset_info == infos
+
+        get_dataset_infos.assert_called_once_with("test_dataset_info_cached_by_repo_id")
+
+    def test_dataset_info_cache(self) -> None:
+        info = Dataset.from_dict({"a": [1, 2], "b": [3, 4]}).info
+        info.splits = SplitDict()
+        info.splits.add(SplitInfo(name="train", num_examples=2))
+        loader = LoadDataFromHub(repo_id="placeholder_name")
+        loader._dataset_info = {"default": info}
+
+        assert loader.outputs == ["a", "b"]
+        assert loader._get_dataset_num_examples() == 2
+
+        loader.split = "test"
+        with pytest.raises(ValueError, match="Split 'test' not found"):
+            loader._get_dataset_num_examples()
+
+    def test_dataset_info_cache_after_config_change(self) -> None:
+        loader = LoadDataFromHub(repo_id="placeholder_name")
+        loader._dataset_info = {
+            "default": Dataset.from_dict({"a": [1]}).info,
+            "other": Dataset.from_dict({"b": [1], "c": [2]}).info,
+        }
+
+        assert loader.outputs == ["a"]
+
+        loader.set_runtime_parameters({"config": "other"})
+
+        assert loader.outputs == ["b", "c"]
+
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            Dataset.from_dict({"a": [1, 2, 3, 4, 5], "b": ["a", "b", "c", "d", "e"]}),
+            Dataset.from_dict(
+                {"a": [1, 2, 3, 4, 5], "b": ["a", "b", "c", "d", "e"]}
+            ).with_format("numpy"),
+            Dataset.from_dict(
+                {"a": [5, 4, 3, 2, 1], "b": ["e", "d", "c", "b", "a"]}
+            ).sort("a"),
+            Dataset.from_dict(
+                {"a": [1, 2, 3, 4, 5], "b": ["a", "b", "c", "d", "e"]}
+            ).to_iterable_dataset(),
+            Dataset.from_dict(
+                {"a": [1, 2, 3, 4, 5], "b": ["a", "b", "c", "d", "e"], "c": [0] * 5}
+            ).with_format("numpy", columns=["a", "b"]),
+            Dataset.from_dict(
+                {"a": [1, 2, 3, 4, 5], "b": ["a", "b", "c", "d", "e"], "c": [0] * 5}
+            ).with_format(None, columns=["a", "b"]),
+            concatenate_datasets(
+                [
+                    Dataset.from_dict({"a": [1, 2, 3], "b": ["a", "b", "c"]}),
+                    Dataset.from_dict({"a": [4, 5], "b": ["d", "e"]}),
+                ]
+            ),
+        ],
+    )
+    def test_process(self, dataset: Union[Dataset, IterableDataset]) -> None:
+        loader = LoadDataFromHub(repo_id="placeholder_name", batch_size=2)
+        loader._dataset = dataset
+        loader.num_examples = 5
+        loader.load()
+
+        batches = list(loader.process())
+
+        assert batches == [
+            ([{"a": 1, "b": "a"}, {"a": 2, "b": "b"}], False),
+            ([{"a": 3, "b": "c"}, {"a": 4, "b": "d"}], False),
+            ([{"a": 5, "b": "e"}], True),
+        ]
+
+    @pytest.mark.parametrize(
+        "prefetch_factor, transform_workers", [(2, None), (0, 2), (4, 2)]
+    )
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            Dataset.from_dict({"a": list(range(50))}),
+            # Read with `Dataset.iter` as Arrow batches following the indices mapping
+            Dataset.from_dict({"a": list(range(50))[::-1]}).sort("a"),
+            # Read with `Dataset.iter` as dictionaries
+            Dataset.from_dict({"a": list(range(50)), "b": [0] * 50}).with_format(
+                None, columns=["a"]
+            ),
+        ],
+    )
+    def test_process_with_prefetch(
+        self,
+        dataset: Dataset,
+        prefetch_factor: int,
+        transform_workers: Union[int, None],
+    ) -> None:
+        loader = LoadDataFromHub(
+            repo_id="placeholder_name",
+            batch_size=3,
+            prefetch_factor=prefetch_factor,
+            transform_workers=transform_workers,
+        )
+        loader._dataset = dataset
+        loader.num_examples = len(dataset)
+        loader.load()
+
+        # More batches than the window of batches submitted to the pool
+        batches = list(loader.process())
+        loader.unload()
+
+        assert [row for batch, _ in batches for row in batch] == [
+            {"a": a} for a in range(50)
+        ]
+        assert [last for _, last in batches] == [False] * 16 + [True]
+
+    def test_process_with_transform_workers_sends_compact_batches(self) -> None:
+        dataset = Dataset.from_dict({"a": list(range(100_000))})
+        loader = LoadDataFromHub(
+            repo_id="placeholder_name", batch_size=10, transform_workers=2
+        )
+        loader._dataset = dataset
+        loader.num_examples = len(dataset)
+        loader.load()
+
+        pool = loader._transform_pool
+        with mock.patch.object(pool, "submit", wraps=pool.submit) as submit:
+            process = loader.process()
+            rows, _ = next(process)
+            process.close()
+        loader.unload()
+
+        assert rows == [{"a": a} for a in range(10)]
+        # The payload of a batch has its rows, not the whole table it was sliced from
+        for call in submit.call_args_list:
+            assert len(pickle.dumps(call.args[1])) < 2_000
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_process_with_offset(self, streaming: bool) -> None:
+        dataset = Dataset.from_dict({"a": list(range(10))})
+        loader = LoadDataFromHub(repo_id="placeholder_name", batch_size=3)
+        loader._dataset = dataset.to_iterable_dataset() if streaming else dataset
+        loader.num_examples = len(dataset)
+        loader.load()
+
+        batches = list(loader.process(offset=6))
+
+        assert batches == [([{"a": 6}, {"a": 7}, {"a": 8}], False), ([{"a": 9}], True)]
+        assert list(loader.process(offset=12)) == []
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_process_nullable_int_column(self, streaming: bool) -> None:
+        dataset = Dataset.from_dict({"a": [1, None, 3]})
+        loader = LoadDataFromHub(repo_id="placeholder_name", batch_size=3)
+        loader._dataset = dataset.to_iterable_dataset() if streaming else dataset
+        loader.num_examples = len(dataset)
+        loader.load()
+
+        (rows, _), *_ = loader.process()
+
+        assert rows == [{"a": 1}, {"a": None}, {"a": 3}]
+        assert type(rows[0]["a"]) is int
+
+    def test_process_iterable_dataset_without_features(self) -> None:
+        def gen() -> Generator[Dict[str, Any], None, None]:
+            yield {"a": 1}
+            yield {"a": "x"}
+
+        dataset = IterableDataset.from_generator(gen)
+        assert dataset.features is None
+        loader = LoadDataFromHub(repo_id="placeholder_name", batch_size=2)
+        loader._dataset = dataset
+        loader.num_examples = 2
+        loader.load()
+
+        assert not loader._can_iter_arrow()
+        assert list(loader.process()) == [([{"a": 1}, {"a": "x"}], True)]
+
+
+def test_prefetch_iter() -> None:
+    assert list(_prefetch_iter(range(100), 4)) == list(range(100))
+
+
+def test_prefetch_iter_raises() -> None:
+    def failing() -> Generator[int, None, None]:
+        yield 1
+        raise RuntimeError("boom")
+
+    iterator = _prefetch_iter(failing(), 2)
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(iterator)
+
 
 class TestLoadDataFromFileSystem:
     @pytest.mark.parametrize("filetype", ["json", None])
@@ -134,6 +348,73 @@ class TestLoadDataFromFileSystem:
             assert isinstance(generator_step_output[1], bool)
             assert len(generator_step_output[0]) == 22
 
+    def test_prepare_data_files_local_folder(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = UPath(tmpdir)
+            for file in [
+                "sample_0.jsonl",
+                "train/sample_1.jsonl",
+                "train/nested/x.jsonl",
+            ]:
+                (data_path / file).parent.mkdir(parents=True, exist_ok=True)
+                (data_path / file).write_text("{}")
+
+            data_files, filetype = LoadDataFromFileSystem._prepare_data_files(data_path)
+
+            assert filetype == "json"
+            assert sorted(data_files) == [
+                str(Path(tmpdir) / "sample_0.jsonl"),
+                str(Path(tmpdir) / "train" / "sample_1.jsonl"),
+            ]
+
+    def test_prepare_data_files_remote_folder(self) -> None:
+        data_path = UPath("memory://test_prepare_data_files_remote_folder")
+        for file in ["sample_0.jsonl", "train/sample_1.jsonl", "train/nested/x.jsonl"]:
+            (data_path / file).parent.mkdir(parents=True, exist_ok=True)
+            (data_path / file).write_text("{}")
+
+        data_files, filetype = LoadDataFromFileSystem._prepare_data_files(data_path)
+
+        assert filetype == "json"
+        assert data_files == [
+            "memory://test_prepare_data_files_remote_folder/sample_0.jsonl",
+            "memory://test_prepare_data_files_remote_folder/train/sample_1.jsonl",
+        ]
+
+    @pytest.mark.parametrize("filetype", ["jsonl", "parquet", "arrow", "csv"])
+    def test_num_examples_streaming(self, filetype: str) -> None:
+        dataset = Dataset.from_json(
+            str(Path(__file__).parent / "sample_functions.jsonl")
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_files = str(Path(tmpdir) / f"sample_functions.{filetype}")
+            if filetype == "jsonl":
+                dataset.to_json(data_files)
+            elif filetype == "parquet":
+                dataset.to_parquet(data_files)
+            elif filetype == "arrow":
+                table = dataset.data.table
+                with pa.ipc.new_stream(data_files, table.schema) as writer:
+                    for batch in table.to_batches(max_chunksize=4):
+                        writer.write_batch(batch)
+            else:
+                dataset.select_columns(["type"]).to_csv(data_files)
+
+            loader = LoadDataFromFileSystem(data_files=data_files, streaming=True)
+            loader.load()
+            assert loader.num_examples == 11
+
+    def test_count_rows_remote(self) -> None:
+        data_path = UPath("memory://test_count_rows_remote")
+        (data_path / "sample_0.jsonl").write_text('{"a": 1}\n{"a": 2}\n\n')
+        (data_path / "sample_1.jsonl").write_text('{"a": 3}')
+
+        data_files, filetype = LoadDataFromFileSystem._prepare_data_files(data_path)
+
+        assert (
+            LoadDataFromFileSystem._count_rows(data_files, filetype, data_path.fs) == 3
+        )
+
     @pytest.mark.parametrize("load", [True, False])
     def test_outputs(self, load: bool) -> None:
         loader = LoadDataFromFileSystem(
@@ -162,7 +443,28 @@ class TestLoadDataFromDisk:
             assert isinstance(generator_step_output[1], bool)
             assert len(generator_step_output[0]) == 3
 
-    def test_load_distiset_from_disk(self) -> None:
+    @pytest.mark.parametrize("num_examples, expected", [(2, 2), (10, 3)])
+    def test_load_dataset_from_disk_with_num_examples(
+        self, num_examples: int, expected: int
+    ) -> None:
+        dataset = Dataset.from_dict({"a": [1, 2, 3]})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dataset_path = str(Path(tmpdir) / "dataset_path")
+            dataset.save_to_disk(dataset_path)
+
+            loader = LoadDataFromDisk(
+                dataset_path=dataset_path, num_examples=num_examples
+            )
+            loader.load()
+            assert loader.num_examples == expected
+            assert list(loader.process()) == [
+                ([{"a": a} for a in range(1, expected + 1)], True)
+            ]
+
+    @pytest.mark.parametrize(
+        "config, expected", [("leaf_step_1", 3), ("leaf_step_2", 4)]
+    )
+    def test_load_distiset_from_disk(self, config: str, expected: int) -> None:
         distiset = Distiset(
             {
                 "leaf_step_1": Dataset.from_dict({"a": [1, 2, 3]}),
@@ -176,10 +478,10 @@ class TestLoadDataFromDisk:
             distiset.save_to_disk(dataset_path)
 
             loader = LoadDataFromDisk(
-                dataset_path=dataset_path, is_distiset=True, config="leaf_step_1"
+                dataset_path=dataset_path, is_distiset=True, config=config
             )
             loader.load()
             generator_step_output = next(loader.process())
             assert isinstance(generator_step_output, tuple)
             assert isinstance(generator_step_output[1], bool)
-            assert len(generator_step_output[0]) == 3
+            assert len(generator_step_output[0]) == expected